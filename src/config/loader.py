@@ -3,7 +3,13 @@
 
 import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# 优先使用 libyaml 的 C 加载器，不可用时回退到纯 Python 实现
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 def replace_env_vars(value: str) -> str:
@@ -31,24 +37,28 @@ def process_dict(config: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-_config_cache: Dict[str, Dict[str, Any]] = {}
+# file_path -> (mtime, processed config)
+_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 
 def load_yaml_config(file_path: str) -> Dict[str, Any]:
     """Load and process YAML configuration file."""
     # 如果文件不存在，返回{}
-    if not os.path.exists(file_path):
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except FileNotFoundError:
         return {}
 
-    # 检查缓存中是否已存在配置
-    if file_path in _config_cache:
-        return _config_cache[file_path]
+    # 检查缓存中是否已存在配置，文件被修改（mtime 变化）时重新加载
+    cached = _config_cache.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
     # 如果缓存中不存在，则加载并处理配置
     with open(file_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_SafeLoader)
     processed_config = process_dict(config)
 
     # 将处理后的配置存入缓存
-    _config_cache[file_path] = processed_config
+    _config_cache[file_path] = (mtime, processed_config)
     return processed_config
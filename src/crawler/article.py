@@ -6,6 +6,8 @@ from urllib.parse import urljoin
 
 from markdownify import markdownify as md
 
+_IMAGE_PATTERN = re.compile(r"!\[.*?\]\((.*?)\)")
+
 
 class Article:
     url: str
@@ -22,10 +24,8 @@ class Article:
         return markdown
 
     def to_message(self) -> list[dict]:
-        image_pattern = r"!\[.*?\]\((.*?)\)"
-
         content: list[dict[str, str]] = []
-        parts = re.split(image_pattern, self.to_markdown())
+        parts = _IMAGE_PATTERN.split(self.to_markdown())
 
         for i, part in enumerate(parts):
             if i % 2 == 1:
@@ -3,11 +3,31 @@
 
 import logging
 import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the calling thread's session for r.jina.ai.
+
+    Consecutive crawls on the same thread reuse pooled keep-alive connections
+    instead of re-doing the TCP/TLS handshake. Sessions are not shared across
+    threads, and cookies are never stored, so crawls stay stateless.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _local.session = session
+    return session
+
 
 class JinaClient:
     def crawl(self, url: str, return_format: str = "html") -> str:
@@ -22,5 +42,5 @@ class JinaClient:
                 "Jina API key is not set. Provide your own key to access a higher rate limit. See https://jina.ai/reader for more information."
             )
         data = {"url": url}
-        response = requests.post("https://r.jina.ai/", headers=headers, json=data)
+        response = _get_session().post("https://r.jina.ai/", headers=headers, json=data)
         return response.text
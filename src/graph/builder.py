@@ -17,21 +17,22 @@ from .nodes import (
     background_investigation_node,
 )
 
+# Node that executes each type of plan step
+_STEP_TYPE_NODES = {
+    StepType.RESEARCH: "researcher",
+    StepType.PROCESSING: "coder",
+}
+
 
 def continue_to_running_research_team(state: State):
     current_plan = state.get("current_plan")
     if not current_plan or not current_plan.steps:
         return "planner"
-    if all(step.execution_res for step in current_plan.steps):
+    # find the first unexecuted step in a single pass over the plan
+    step = next((step for step in current_plan.steps if not step.execution_res), None)
+    if step is None:
         return "planner"
-    for step in current_plan.steps:
-        if not step.execution_res:
-            break
-    if step.step_type and step.step_type == StepType.RESEARCH:
-        return "researcher"
-    if step.step_type and step.step_type == StepType.PROCESSING:
-        return "coder"
-    return "planner"
+    return _STEP_TYPE_NODES.get(step.step_type, "planner")
 
 
 def _build_base_graph():
@@ -85,6 +85,11 @@ def planner_node(
     logger.info("Planner generating full plan")
     configurable = Configuration.from_runnable_config(config)
     plan_iterations = state["plan_iterations"] if state.get("plan_iterations", 0) else 0
+
+    # if the plan iterations is greater than the max plan iterations, return the reporter node
+    if plan_iterations >= configurable.max_plan_iterations:
+        return Command(goto="reporter")
+
     messages = apply_prompt_template("planner", state, configurable)
 
     if (
@@ -111,10 +116,6 @@ def planner_node(
     else:
         llm = get_llm_by_type(AGENT_LLM_MAP["planner"])
 
-    # if the plan iterations is greater than the max plan iterations, return the reporter node
-    if plan_iterations >= configurable.max_plan_iterations:
-        return Command(goto="reporter")
-
     full_response = ""
     if AGENT_LLM_MAP["planner"] == "basic":
         response = llm.invoke(messages)
@@ -123,7 +124,7 @@ def planner_node(
         response = llm.stream(messages)
         for chunk in response:
             full_response += chunk.content
-    logger.debug(f"Current state messages: {state['messages']}")
+    logger.debug("Current state messages: %s", state["messages"])
     logger.info(f"Planner response: {full_response}")
 
     try:
@@ -217,7 +218,7 @@ def coordinator_node(
         .bind_tools([handoff_to_planner])
         .invoke(messages)
     )
-    logger.debug(f"Current state messages: {state['messages']}")
+    logger.debug("Current state messages: %s", state["messages"])
 
     goto = "__end__"
     locale = state.get("locale", "en-US")  # Default locale if not specified
@@ -235,12 +236,12 @@ def coordinator_node(
                     locale = tool_locale
                     break
         except Exception as e:
-            logger.error(f"Error processing tool calls: {e}")
+            logger.error("Error processing tool calls: %s", e)
     else:
         logger.warning(
             "Coordinator response contains no tool calls. Terminating workflow execution."
         )
-        logger.debug(f"Coordinator response: {response}")
+        logger.debug("Coordinator response: %s", response)
 
     return Command(
         update={"locale": locale, "resources": configurable.resources},
@@ -278,7 +279,7 @@ def reporter_node(state: State):
                 name="observation",
             )
         )
-    logger.debug(f"Current invoke messages: {invoke_messages}")
+    logger.debug("Current invoke messages: %s", invoke_messages)
     response = get_llm_by_type(AGENT_LLM_MAP["reporter"]).invoke(invoke_messages)
     response_content = response.content
     logger.info(f"reporter response: {response_content}")
@@ -384,7 +385,7 @@ async def _execute_agent_step(
 
     # Process the result
     response_content = result["messages"][-1].content
-    logger.debug(f"{agent_name.capitalize()} full response: {response_content}")
+    logger.debug("%s full response: %s", agent_name.capitalize(), response_content)
 
     # Update the step with the execution result
     current_step.execution_res = response_content
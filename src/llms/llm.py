@@ -13,6 +13,13 @@ from src.config.agents import LLMType
 # Cache for LLM instances
 _llm_cache: dict[LLMType, ChatOpenAI] = {}
 
+# conf.yaml section holding the settings of each LLM type
+_LLM_TYPE_CONF_KEYS: dict[LLMType, str] = {
+    "reasoning": "REASONING_MODEL",
+    "basic": "BASIC_MODEL",
+    "vision": "VISION_MODEL",
+}
+
 
 def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
     """
@@ -30,12 +37,8 @@ def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
 
 
 def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> ChatOpenAI:
-    llm_type_map = {
-        "reasoning": conf.get("REASONING_MODEL", {}),
-        "basic": conf.get("BASIC_MODEL", {}),
-        "vision": conf.get("VISION_MODEL", {}),
-    }
-    llm_conf = llm_type_map.get(llm_type)
+    conf_key = _LLM_TYPE_CONF_KEYS.get(llm_type)
+    llm_conf = conf.get(conf_key, {}) if conf_key else None
     if not isinstance(llm_conf, dict):
         raise ValueError(f"Invalid LLM Conf: {llm_type}")
     # Get configuration from environment variables
@@ -26,5 +26,5 @@ def script_writer_node(state: PodcastState):
             HumanMessage(content=state["input"]),
         ],
     )
-    print(script)
+    logger.debug("Generated podcast script: %s", script)
     return {"script": script, "audio_chunks": []}
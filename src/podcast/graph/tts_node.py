@@ -4,6 +4,7 @@
 import base64
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from src.podcast.graph.state import PodcastState
 from src.tools.tts import VolcengineTTS
@@ -13,24 +14,39 @@ logger = logging.getLogger(__name__)
 
 def tts_node(state: PodcastState):
     logger.info("Generating audio chunks for podcast...")
-    tts_client = _create_tts_client()
-    for line in state["script"].lines:
-        tts_client.voice_type = (
-            "BV002_streaming" if line.speaker == "male" else "BV001_streaming"
-        )
-        result = tts_client.text_to_speech(line.paragraph, speed_ratio=1.05)
-        if result["success"]:
-            audio_data = result["audio_data"]
-            audio_chunk = base64.b64decode(audio_data)
-            state["audio_chunks"].append(audio_chunk)
-        else:
-            logger.error(result["error"])
+    tts_clients = {
+        "male": _create_tts_client("BV002_streaming"),
+        "female": _create_tts_client("BV001_streaming"),
+    }
+
+    def synthesize(line):
+        tts_client = tts_clients["male" if line.speaker == "male" else "female"]
+        return tts_client.text_to_speech(line.paragraph, speed_ratio=1.05)
+
+    # Lines are independent requests, so synthesize them concurrently, bounded
+    # by the account's TTS concurrency quota; executor.map keeps script order.
+    lines = state["script"].lines
+    with ThreadPoolExecutor(max_workers=_get_max_workers()) as executor:
+        for index, (line, result) in enumerate(
+            zip(lines, executor.map(synthesize, lines))
+        ):
+            if result["success"]:
+                audio_data = result["audio_data"]
+                audio_chunk = base64.b64decode(audio_data)
+                state["audio_chunks"].append(audio_chunk)
+            else:
+                logger.error(
+                    "Failed to generate audio for line %d (%s): %s",
+                    index,
+                    line.speaker,
+                    result["error"],
+                )
     return {
         "audio_chunks": state["audio_chunks"],
     }
 
 
-def _create_tts_client():
+def _create_tts_client(voice_type: str):
     app_id = os.getenv("VOLCENGINE_TTS_APPID", "")
     if not app_id:
         raise Exception("VOLCENGINE_TTS_APPID is not set")
@@ -38,10 +54,13 @@ def _create_tts_client():
     if not access_token:
         raise Exception("VOLCENGINE_TTS_ACCESS_TOKEN is not set")
     cluster = os.getenv("VOLCENGINE_TTS_CLUSTER", "volcano_tts")
-    voice_type = "BV001_streaming"
     return VolcengineTTS(
         appid=app_id,
         access_token=access_token,
         cluster=cluster,
         voice_type=voice_type,
     )
+
+
+def _get_max_workers() -> int:
+    return max(1, int(os.getenv("VOLCENGINE_TTS_MAX_WORKERS", "2")))
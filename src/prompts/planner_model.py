@@ -4,7 +4,7 @@
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StepType(str, Enum):
@@ -34,8 +34,8 @@ class Plan(BaseModel):
         description="Research & Processing steps to get more context",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "has_enough_context": False,
@@ -56,3 +56,4 @@ class Plan(BaseModel):
                 }
             ]
         }
+    )
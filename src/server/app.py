@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import base64
 import json
 import logging
@@ -206,8 +207,9 @@ async def text_to_speech(request: TTSRequest):
             cluster=cluster,
             voice_type=voice_type,
         )
-        # Call the TTS API
-        result = tts_client.text_to_speech(
+        # Call the TTS API in a worker thread to keep the event loop responsive
+        result = await asyncio.to_thread(
+            tts_client.text_to_speech,
             text=request.text[:1024],
             encoding=request.encoding,
             speed_ratio=request.speed_ratio,
@@ -235,7 +237,7 @@ async def text_to_speech(request: TTSRequest):
             },
         )
     except Exception as e:
-        logger.exception(f"Error in TTS endpoint: {str(e)}")
+        logger.exception("Error in TTS endpoint: %s", e)
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
@@ -243,13 +245,13 @@ async def text_to_speech(request: TTSRequest):
 async def generate_podcast(request: GeneratePodcastRequest):
     try:
         report_content = request.content
-        print(report_content)
+        logger.debug("Generating podcast from report: %s", report_content)
         workflow = build_podcast_graph()
-        final_state = workflow.invoke({"input": report_content})
+        final_state = await workflow.ainvoke({"input": report_content})
         audio_bytes = final_state["output"]
         return Response(content=audio_bytes, media_type="audio/mp3")
     except Exception as e:
-        logger.exception(f"Error occurred during podcast generation: {str(e)}")
+        logger.exception("Error occurred during podcast generation: %s", e)
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
@@ -257,9 +259,9 @@ async def generate_podcast(request: GeneratePodcastRequest):
 async def generate_ppt(request: GeneratePPTRequest):
     try:
         report_content = request.content
-        print(report_content)
+        logger.debug("Generating ppt from report: %s", report_content)
         workflow = build_ppt_graph()
-        final_state = workflow.invoke({"input": report_content})
+        final_state = await workflow.ainvoke({"input": report_content})
         generated_file_path = final_state["generated_file_path"]
         with open(generated_file_path, "rb") as f:
             ppt_bytes = f.read()
@@ -268,7 +270,7 @@ async def generate_ppt(request: GeneratePPTRequest):
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
         )
     except Exception as e:
-        logger.exception(f"Error occurred during ppt generation: {str(e)}")
+        logger.exception("Error occurred during ppt generation: %s", e)
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
@@ -292,7 +294,7 @@ async def generate_prose(request: GenerateProseRequest):
             media_type="text/event-stream",
         )
     except Exception as e:
-        logger.exception(f"Error occurred during prose generation: {str(e)}")
+        logger.exception("Error occurred during prose generation: %s", e)
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
@@ -330,7 +332,7 @@ async def mcp_server_metadata(request: MCPServerMetadataRequest):
         return response
     except Exception as e:
         if not isinstance(e, HTTPException):
-            logger.exception(f"Error in MCP server metadata endpoint: {str(e)}")
+            logger.exception("Error in MCP server metadata endpoint: %s", e)
             raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
         raise
 
@@ -346,5 +348,6 @@ async def rag_resources(request: Annotated[RAGResourceRequest, Query()]):
     """Get the resources of the RAG."""
     retriever = build_retriever()
     if retriever:
-        return RAGResourcesResponse(resources=retriever.list_resources(request.query))
+        resources = await asyncio.to_thread(retriever.list_resources, request.query)
+        return RAGResourcesResponse(resources=resources)
     return RAGResourcesResponse(resources=[])
@@ -99,6 +99,6 @@ async def load_mcp_tools(
 
     except Exception as e:
         if not isinstance(e, HTTPException):
-            logger.exception(f"Error loading MCP tools: {str(e)}")
+            logger.exception("Error loading MCP tools: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
         raise
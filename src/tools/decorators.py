@@ -3,7 +3,7 @@
 
 import logging
 import functools
-from typing import Any, Callable, Type, TypeVar
+from typing import Any, Callable, ClassVar, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +20,15 @@ def log_io(func: Callable) -> Callable:
     Returns:
         The wrapped function with input/output logging
     """
+    func_name = func.__name__
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Skip formatting parameters and results when nothing would be logged
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
         # Log input parameters
-        func_name = func.__name__
         params = ", ".join(
             [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
         )
@@ -44,9 +48,12 @@ def log_io(func: Callable) -> Callable:
 class LoggedToolMixin:
     """A mixin class that adds logging functionality to any tool."""
 
+    # Name of the wrapped tool class, set once by create_logged_tool
+    _base_tool_name: ClassVar[str] = ""
+
     def _log_operation(self, method_name: str, *args: Any, **kwargs: Any) -> None:
         """Helper method to log tool operations."""
-        tool_name = self.__class__.__name__.replace("Logged", "")
+        tool_name = self._base_tool_name
         params = ", ".join(
             [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
         )
@@ -54,11 +61,11 @@ class LoggedToolMixin:
 
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         """Override _run method to add logging."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return super()._run(*args, **kwargs)
         self._log_operation("_run", *args, **kwargs)
         result = super()._run(*args, **kwargs)
-        logger.debug(
-            f"Tool {self.__class__.__name__.replace('Logged', '')} returned: {result}"
-        )
+        logger.debug(f"Tool {self._base_tool_name} returned: {result}")
         return result
 
 
@@ -74,7 +81,7 @@ def create_logged_tool(base_tool_class: Type[T]) -> Type[T]:
     """
 
     class LoggedTool(LoggedToolMixin, base_tool_class):
-        pass
+        _base_tool_name: ClassVar[str] = base_tool_class.__name__
 
     # Set a more descriptive name for the class
     LoggedTool.__name__ = f"Logged{base_tool_class.__name__}"
@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import logging
 from typing import List, Optional, Type
 from langchain_core.tools import BaseTool
@@ -48,7 +49,7 @@ class RetrieverTool(BaseTool):
         keywords: str,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> list[Document]:
-        return self._run(keywords, run_manager.get_sync())
+        return await asyncio.to_thread(self._run, keywords, run_manager.get_sync())
 
 
 def get_retriever_tool(resources: List[Resource]) -> RetrieverTool | None:
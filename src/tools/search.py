@@ -1,14 +1,11 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import functools
 import json
 import logging
 import os
 
-from langchain_community.tools import BraveSearch, DuckDuckGoSearchResults
-from langchain_community.tools.arxiv import ArxivQueryRun
-from langchain_community.utilities import ArxivAPIWrapper, BraveSearchWrapper
-
 from src.config import SearchEngine, SELECTED_SEARCH_ENGINE
 from src.tools.tavily_search.tavily_search_results_with_images import (
     TavilySearchResultsWithImages,
@@ -18,48 +15,92 @@ from src.tools.decorators import create_logged_tool
 
 logger = logging.getLogger(__name__)
 
-# Create logged versions of the search tools
+# Create logged version of the default search tool
 LoggedTavilySearch = create_logged_tool(TavilySearchResultsWithImages)
-LoggedDuckDuckGoSearch = create_logged_tool(DuckDuckGoSearchResults)
-LoggedBraveSearch = create_logged_tool(BraveSearch)
-LoggedArxivSearch = create_logged_tool(ArxivQueryRun)
+
+
+# The other search backends are only imported when selected
+@functools.lru_cache(maxsize=None)
+def _logged_duckduckgo_search():
+    from langchain_community.tools import DuckDuckGoSearchResults
+
+    return create_logged_tool(DuckDuckGoSearchResults)
+
+
+@functools.lru_cache(maxsize=None)
+def _logged_brave_search():
+    from langchain_community.tools import BraveSearch
+
+    return create_logged_tool(BraveSearch)
+
+
+@functools.lru_cache(maxsize=None)
+def _logged_arxiv_search():
+    from langchain_community.tools.arxiv import ArxivQueryRun
+
+    return create_logged_tool(ArxivQueryRun)
+
+
+def _tavily_search_tool(max_search_results: int):
+    return LoggedTavilySearch(
+        name="web_search",
+        max_results=max_search_results,
+        include_raw_content=True,
+        include_images=True,
+        include_image_descriptions=True,
+    )
+
+
+def _duckduckgo_search_tool(max_search_results: int):
+    return _logged_duckduckgo_search()(
+        name="web_search", max_results=max_search_results
+    )
+
+
+def _brave_search_tool(max_search_results: int):
+    from langchain_community.utilities import BraveSearchWrapper
+
+    return _logged_brave_search()(
+        name="web_search",
+        search_wrapper=BraveSearchWrapper(
+            api_key=os.getenv("BRAVE_SEARCH_API_KEY", ""),
+            search_kwargs={"count": max_search_results},
+        ),
+    )
+
+
+def _arxiv_search_tool(max_search_results: int):
+    from langchain_community.utilities import ArxivAPIWrapper
+
+    return _logged_arxiv_search()(
+        name="web_search",
+        api_wrapper=ArxivAPIWrapper(
+            top_k_results=max_search_results,
+            load_max_docs=max_search_results,
+            load_all_available_meta=True,
+        ),
+    )
+
+
+# Map each search engine to the factory that builds its tool
+_SEARCH_TOOL_FACTORIES = {
+    SearchEngine.TAVILY.value: _tavily_search_tool,
+    SearchEngine.DUCKDUCKGO.value: _duckduckgo_search_tool,
+    SearchEngine.BRAVE_SEARCH.value: _brave_search_tool,
+    SearchEngine.ARXIV.value: _arxiv_search_tool,
+}
 
 
 # Get the selected search tool
 def get_web_search_tool(max_search_results: int):
-    if SELECTED_SEARCH_ENGINE == SearchEngine.TAVILY.value:
-        return LoggedTavilySearch(
-            name="web_search",
-            max_results=max_search_results,
-            include_raw_content=True,
-            include_images=True,
-            include_image_descriptions=True,
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.DUCKDUCKGO.value:
-        return LoggedDuckDuckGoSearch(name="web_search", max_results=max_search_results)
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.BRAVE_SEARCH.value:
-        return LoggedBraveSearch(
-            name="web_search",
-            search_wrapper=BraveSearchWrapper(
-                api_key=os.getenv("BRAVE_SEARCH_API_KEY", ""),
-                search_kwargs={"count": max_search_results},
-            ),
-        )
-    elif SELECTED_SEARCH_ENGINE == SearchEngine.ARXIV.value:
-        return LoggedArxivSearch(
-            name="web_search",
-            api_wrapper=ArxivAPIWrapper(
-                top_k_results=max_search_results,
-                load_max_docs=max_search_results,
-                load_all_available_meta=True,
-            ),
-        )
-    else:
+    factory = _SEARCH_TOOL_FACTORIES.get(SELECTED_SEARCH_ENGINE)
+    if factory is None:
         raise ValueError(f"Unsupported search engine: {SELECTED_SEARCH_ENGINE}")
+    return factory(max_search_results)
 
 
 if __name__ == "__main__":
-    results = LoggedDuckDuckGoSearch(
+    results = _logged_duckduckgo_search()(
         name="web_search", max_results=3, output_format="list"
     )
     print(results.name)
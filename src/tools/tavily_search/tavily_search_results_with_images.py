@@ -1,4 +1,5 @@
 import json
+import logging
 from typing import Dict, List, Optional, Tuple, Union
 
 from langchain.callbacks.manager import (
@@ -12,6 +13,8 @@ from src.tools.tavily_search.tavily_search_api_wrapper import (
     EnhancedTavilySearchAPIWrapper,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[override, override]
     """Tool that queries the Tavily Search API and gets back json.
@@ -120,7 +123,10 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
         except Exception as e:
             return repr(e), {}
         cleaned_results = self.api_wrapper.clean_results_with_images(raw_results)
-        print("sync", json.dumps(cleaned_results, indent=2, ensure_ascii=False))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "sync %s", json.dumps(cleaned_results, indent=2, ensure_ascii=False)
+            )
         return cleaned_results, raw_results
 
     async def _arun(
@@ -144,5 +150,8 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
         except Exception as e:
             return repr(e), {}
         cleaned_results = self.api_wrapper.clean_results_with_images(raw_results)
-        print("async", json.dumps(cleaned_results, indent=2, ensure_ascii=False))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "async %s", json.dumps(cleaned_results, indent=2, ensure_ascii=False)
+            )
         return cleaned_results, raw_results
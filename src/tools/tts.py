@@ -103,18 +103,18 @@ class VolcengineTTS:
 
         try:
             sanitized_text = text.replace("\r\n", "").replace("\n", "")
-            logger.debug(f"Sending TTS request for text: {sanitized_text[:50]}...")
+            logger.debug("Sending TTS request for text: %s...", sanitized_text[:50])
             response = requests.post(
                 self.api_url, json.dumps(request_json), headers=self.header
             )
             response_json = response.json()
 
             if response.status_code != 200:
-                logger.error(f"TTS API error: {response_json}")
+                logger.error("TTS API error: %s", response_json)
                 return {"success": False, "error": response_json, "audio_data": None}
 
             if "data" not in response_json:
-                logger.error(f"TTS API returned no data: {response_json}")
+                logger.error("TTS API returned no data: %s", response_json)
                 return {
                     "success": False,
                     "error": "No audio data returned",
@@ -128,5 +128,5 @@ class VolcengineTTS:
             }
 
         except Exception as e:
-            logger.exception(f"Error in TTS API call: {str(e)}")
+            logger.exception("Error in TTS API call: %s", e)
             return {"success": False, "error": str(e), "audio_data": None}
@@ -35,5 +35,5 @@ def repair_json_output(content: str) -> str:
             repaired_content = json_repair.loads(content)
             return json.dumps(repaired_content, ensure_ascii=False)
         except Exception as e:
-            logger.warning(f"JSON repair failed: {e}")
+            logger.warning("JSON repair failed: %s", e)
     return content
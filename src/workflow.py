@@ -92,7 +92,7 @@ async def run_agent_workflow_async(
                 # For any other output format
                 print(f"Output: {s}")
         except Exception as e:
-            logger.error(f"Error processing stream output: {e}")
+            logger.error("Error processing stream output: %s", e)
             print(f"Error processing output: {str(e)}")
 
     logger.info("Async workflow completed successfully")
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+# mock 掉 get_llm_by_type，避免导入 nodes 时需要 LLM 配置
+with patch("src.llms.llm.get_llm_by_type", return_value=MagicMock()):
+    from src.graph.builder import continue_to_running_research_team
+    from src.prompts.planner_model import Plan, Step, StepType
+
+
+def make_step(step_type, execution_res=None):
+    return Step(
+        need_search=True,
+        title="step",
+        description="step description",
+        step_type=step_type,
+        execution_res=execution_res,
+    )
+
+
+def make_plan(steps):
+    return Plan(
+        locale="en-US",
+        has_enough_context=False,
+        thought="thought",
+        title="plan",
+        steps=steps,
+    )
+
+
+def test_no_plan_routes_to_planner():
+    assert continue_to_running_research_team({}) == "planner"
+    assert continue_to_running_research_team({"current_plan": None}) == "planner"
+    assert (
+        continue_to_running_research_team({"current_plan": make_plan([])}) == "planner"
+    )
+
+
+def test_all_steps_executed_routes_to_planner():
+    plan = make_plan(
+        [
+            make_step(StepType.RESEARCH, execution_res="done"),
+            make_step(StepType.PROCESSING, execution_res="done"),
+        ]
+    )
+    assert continue_to_running_research_team({"current_plan": plan}) == "planner"
+
+
+@pytest.mark.parametrize(
+    "step_type, expected",
+    [(StepType.RESEARCH, "researcher"), (StepType.PROCESSING, "coder")],
+)
+def test_first_unexecuted_step_selects_node(step_type, expected):
+    plan = make_plan(
+        [
+            make_step(StepType.RESEARCH, execution_res="done"),
+            make_step(step_type),
+            make_step(StepType.RESEARCH),
+        ]
+    )
+    assert continue_to_running_research_team({"current_plan": plan}) == expected
+
+
+def test_step_without_type_routes_to_planner():
+    step = make_step(StepType.RESEARCH)
+    step.step_type = None
+    plan = make_plan([step])
+    assert continue_to_running_research_team({"current_plan": plan}) == "planner"
@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import logging
+
+from src.tools.decorators import create_logged_tool, log_io
+
+
+class EchoTool:
+    def _run(self, text):
+        return text
+
+
+LoggedEchoTool = create_logged_tool(EchoTool)
+
+
+@log_io
+def add(a, b=0):
+    return a + b
+
+
+def test_log_io_logs_parameters_and_result(caplog):
+    """Test that log_io logs the call and its result at INFO level"""
+    with caplog.at_level(logging.INFO, logger="src.tools.decorators"):
+        assert add(1, b=2) == 3
+    assert "Tool add called with parameters: 1, b=2" in caplog.text
+    assert "Tool add returned: 3" in caplog.text
+
+
+def test_log_io_silent_when_info_disabled(caplog):
+    """Test that log_io only calls through when INFO logging is disabled"""
+    with caplog.at_level(logging.WARNING, logger="src.tools.decorators"):
+        assert add(1, b=2) == 3
+    assert caplog.text == ""
+
+
+def test_log_io_preserves_metadata():
+    """Test that the wrapped function keeps its name"""
+    assert add.__name__ == "add"
+
+
+def test_logged_tool_logs_base_tool_name(caplog):
+    """Test that logged tools report the wrapped tool class name"""
+    assert LoggedEchoTool.__name__ == "LoggedEchoTool"
+    with caplog.at_level(logging.DEBUG, logger="src.tools.decorators"):
+        assert LoggedEchoTool()._run("hi") == "hi"
+    assert "Tool EchoTool._run called with parameters: hi" in caplog.text
+    assert "Tool EchoTool returned: hi" in caplog.text
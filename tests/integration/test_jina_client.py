@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import threading
+import urllib.request
+from email.message import Message
+from unittest.mock import MagicMock, patch
+
+from src.crawler import jina_client
+from src.crawler.jina_client import JinaClient
+
+
+def test_crawl_posts_url_and_headers(monkeypatch):
+    """Test that crawl sends the URL and headers through the session."""
+    monkeypatch.setenv("JINA_API_KEY", "test_key")
+    session = MagicMock()
+    session.post.return_value.text = "<html></html>"
+
+    with patch.object(jina_client, "_get_session", return_value=session):
+        result = JinaClient().crawl("https://example.com", return_format="html")
+
+    assert result == "<html></html>"
+    session.post.assert_called_once_with(
+        "https://r.jina.ai/",
+        headers={
+            "Content-Type": "application/json",
+            "X-Return-Format": "html",
+            "Authorization": "Bearer test_key",
+        },
+        json={"url": "https://example.com"},
+    )
+
+
+def test_crawl_without_api_key_omits_authorization(monkeypatch):
+    """Test that no Authorization header is sent without an API key."""
+    monkeypatch.delenv("JINA_API_KEY", raising=False)
+    session = MagicMock()
+
+    with patch.object(jina_client, "_get_session", return_value=session):
+        JinaClient().crawl("https://example.com")
+
+    assert "Authorization" not in session.post.call_args.kwargs["headers"]
+
+
+def test_session_is_per_thread_and_reused():
+    """Test that each thread gets its own session, reused across calls."""
+    sessions = []
+    thread = threading.Thread(
+        target=lambda: sessions.append(jina_client._get_session())
+    )
+    thread.start()
+    thread.join()
+
+    assert jina_client._get_session() is jina_client._get_session()
+    assert sessions[0] is not jina_client._get_session()
+
+
+def test_session_does_not_store_cookies():
+    """Test that cookies set by the server are not kept between crawls."""
+    headers = Message()
+    headers["Set-Cookie"] = "sid=abc; Path=/"
+    response = MagicMock()
+    response.info.return_value = headers
+    request = urllib.request.Request("https://r.jina.ai/")
+
+    cookies = jina_client._get_session().cookies
+    cookies.extract_cookies(response, request)
+
+    assert len(cookies) == 0
@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.config import SearchEngine
+from src.tools.search import get_web_search_tool
+
+
+@pytest.mark.parametrize(
+    "search_engine, tool_class_name",
+    [
+        (SearchEngine.TAVILY.value, "LoggedTavilySearchResultsWithImages"),
+        (SearchEngine.DUCKDUCKGO.value, "LoggedDuckDuckGoSearchResults"),
+        (SearchEngine.BRAVE_SEARCH.value, "LoggedBraveSearch"),
+        (SearchEngine.ARXIV.value, "LoggedArxivQueryRun"),
+    ],
+)
+def test_get_web_search_tool(monkeypatch, search_engine, tool_class_name):
+    """Test that each search engine builds its logged web_search tool"""
+    monkeypatch.setenv("TAVILY_API_KEY", "test_key")
+    with patch("src.tools.search.SELECTED_SEARCH_ENGINE", search_engine):
+        tool = get_web_search_tool(3)
+    assert tool.name == "web_search"
+    assert type(tool).__name__ == tool_class_name
+
+
+def test_get_web_search_tool_unsupported_engine():
+    """Test that an unknown search engine raises ValueError"""
+    with patch("src.tools.search.SELECTED_SEARCH_ENGINE", "unknown"):
+        with pytest.raises(ValueError, match="Unsupported search engine: unknown"):
+            get_web_search_tool(3)
+
+
+def test_search_module_does_not_import_optional_backends():
+    """Test that importing the module only loads the default search backend"""
+    code = (
+        "import sys\n"
+        "import src.tools.search\n"
+        "print(','.join(m for m in ("
+        "'langchain_community.tools.ddg_search.tool',"
+        "'langchain_community.tools.brave_search.tool',"
+        "'langchain_community.tools.arxiv.tool',"
+        ") if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -7,6 +7,8 @@ from unittest.mock import patch, MagicMock
 import uuid
 import base64
 
+from src.podcast.graph.tts_node import _get_max_workers, tts_node
+from src.podcast.types import Script, ScriptLine
 from src.tools.tts import VolcengineTTS
 
 
@@ -229,3 +231,50 @@ class TestVolcengineTTS:
         args, kwargs = mock_post.call_args
         request_json = json.loads(args[1])
         assert request_json["user"]["uid"] == str(mock_uuid_value)
+
+
+class TestPodcastTTSNode:
+    """Test suite for the podcast tts_node."""
+
+    @pytest.fixture(autouse=True)
+    def tts_env(self, monkeypatch):
+        monkeypatch.setenv("VOLCENGINE_TTS_APPID", "test_appid")
+        monkeypatch.setenv("VOLCENGINE_TTS_ACCESS_TOKEN", "test_token")
+
+    @staticmethod
+    def fake_text_to_speech(self, text, **kwargs):
+        if text == "fail":
+            return {"success": False, "error": "boom", "audio_data": None}
+        audio = f"{self.voice_type}:{text}".encode()
+        return {"success": True, "audio_data": base64.b64encode(audio).decode()}
+
+    def test_tts_node_keeps_script_order_and_voices(self, caplog):
+        """Test that audio chunks follow script order with per-speaker voices."""
+        script = Script(
+            lines=[
+                ScriptLine(speaker="male", paragraph="one"),
+                ScriptLine(speaker="female", paragraph="two"),
+                ScriptLine(speaker="male", paragraph="fail"),
+                ScriptLine(speaker="female", paragraph="three"),
+            ]
+        )
+        state = {"script": script, "audio_chunks": []}
+
+        with patch.object(VolcengineTTS, "text_to_speech", self.fake_text_to_speech):
+            result = tts_node(state)
+
+        assert result["audio_chunks"] == [
+            b"BV002_streaming:one",
+            b"BV001_streaming:two",
+            b"BV001_streaming:three",
+        ]
+        assert "Failed to generate audio for line 2 (male): boom" in caplog.text
+
+    def test_tts_node_max_workers_from_env(self, monkeypatch):
+        """Test that the TTS concurrency limit is read from the environment."""
+        monkeypatch.delenv("VOLCENGINE_TTS_MAX_WORKERS", raising=False)
+        assert _get_max_workers() == 2
+        monkeypatch.setenv("VOLCENGINE_TTS_MAX_WORKERS", "5")
+        assert _get_max_workers() == 5
+        monkeypatch.setenv("VOLCENGINE_TTS_MAX_WORKERS", "0")
+        assert _get_max_workers() == 1
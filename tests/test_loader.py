@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import os
+
+from src.config.loader import load_yaml_config
+
+
+def test_load_yaml_config_missing_file(tmp_path):
+    """Test that a missing config file yields an empty config."""
+    assert load_yaml_config(str(tmp_path / "missing.yaml")) == {}
+
+
+def test_load_yaml_config_cached(tmp_path):
+    """Test that an unchanged config file is served from the cache."""
+    config_path = tmp_path / "conf.yaml"
+    config_path.write_text("BASIC_MODEL:\n  model: test-model\n")
+
+    first = load_yaml_config(str(config_path))
+    second = load_yaml_config(str(config_path))
+    assert first == {"BASIC_MODEL": {"model": "test-model"}}
+    assert first is second
+
+
+def test_load_yaml_config_reloads_on_change(tmp_path):
+    """Test that editing the config file invalidates the cached config."""
+    config_path = tmp_path / "conf.yaml"
+    config_path.write_text("BASIC_MODEL:\n  model: old-model\n")
+    assert load_yaml_config(str(config_path))["BASIC_MODEL"]["model"] == "old-model"
+
+    config_path.write_text("BASIC_MODEL:\n  model: new-model\n")
+    mtime = os.stat(config_path).st_mtime
+    os.utime(config_path, (mtime + 1, mtime + 1))
+    assert load_yaml_config(str(config_path))["BASIC_MODEL"]["model"] == "new-model"
+
+
+def test_load_yaml_config_replaces_env_vars(tmp_path, monkeypatch):
+    """Test that $VAR values are resolved from the environment."""
+    monkeypatch.setenv("TEST_LOADER_API_KEY", "secret")
+    config_path = tmp_path / "conf.yaml"
+    config_path.write_text("BASIC_MODEL:\n  api_key: $TEST_LOADER_API_KEY\n")
+
+    config = load_yaml_config(str(config_path))
+    assert config["BASIC_MODEL"]["api_key"] == "secret"